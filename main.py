@@ -12,12 +12,16 @@ from advisor.config import load_credentials
 async def _run_async(args: argparse.Namespace) -> None:
     credentials = load_credentials(args.credentials)
     advisor = FantasyAdvisor(credentials)
-    advice = await advisor.advise_lineup(
-        league_id=args.league_id,
-        week=args.week,
-        roster_id=args.roster_id,
-    )
-    print(advice)
+    try:
+        async for chunk in advisor.stream_lineup_advice(
+            league_id=args.league_id,
+            week=args.week,
+            roster_id=args.roster_id,
+        ):
+            print(chunk, end="", flush=True)
+        print()
+    finally:
+        await advisor.aclose()
 
 
 def parse_args() -> argparse.Namespace:
@@ -2,15 +2,20 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import Iterable, Optional
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Iterable, Mapping, Optional, TypeVar
 
 import httpx
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from .clients.base import HttpClientFactory
-from .clients.espn import ESPNClient
-from .clients.fantasypros import FantasyProsClient
+from .clients.espn import ESPNClient, TeamGame
+from .clients.fantasypros import (
+    FantasyProsClient,
+    FantasyProsProjection,
+    index_projections_by_name,
+    normalize_player_name,
+)
 from .clients.sleeper import SleeperClient, SleeperPlayer
 from .clients.weather import WeatherClient
 from .config import Credentials
@@ -18,11 +23,23 @@ from .models import PlayerContext, TeamContext
 from .prompt_builder import build_prompt
 
 
+MAX_CONCURRENT_PLAYERS = 8
+# Sleeper position codes FantasyPros publishes projections for (Sleeper labels team defenses "DEF")
+FANTASYPROS_POSITIONS = frozenset({"QB", "RB", "WR", "TE", "K", "DEF"})
+
+_T = TypeVar("_T")
+
+
+class AdviceGenerationError(RuntimeError):
+    """Raised when OpenAI fails or stops early while streaming lineup advice."""
+
+
 class FantasyAdvisor:
     def __init__(self, credentials: Credentials) -> None:
         self._credentials = credentials
         self._http_factory = HttpClientFactory()
-        self._openai = OpenAI(api_key=credentials.openai_api_key)
+        self._openai = AsyncOpenAI(api_key=credentials.openai_api_key)
+        self._player_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PLAYERS)
 
     async def advise_lineup(
         self,
@@ -43,105 +60,178 @@ class FantasyAdvisor:
             Optional roster id; if omitted, the first roster is used.
         """
 
-        async with self._http_factory.client() as http_client:
-            sleeper = SleeperClient(http_client)
-            espn = ESPNClient(
-                http_client,
-                espn_s2=self._credentials.espn_s2,
-                swid=self._credentials.swid,
-            )
-            fantasypros = FantasyProsClient(http_client, api_key=self._credentials.fantasypros_api_key)
-            weather = WeatherClient(http_client, api_key=self._credentials.openweather_api_key)
+        chunks = [
+            chunk
+            async for chunk in self.stream_lineup_advice(league_id=league_id, week=week, roster_id=roster_id)
+        ]
+        return "".join(chunks)
 
-            rosters, users, matchups = await asyncio.gather(
-                sleeper.get_league_rosters(league_id),
-                sleeper.get_league_users(league_id),
-                sleeper.get_matchups(league_id, week),
-            )
+    async def stream_lineup_advice(
+        self,
+        *,
+        league_id: str,
+        week: int,
+        roster_id: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Yield lineup advice text as OpenAI generates it.
 
-            roster_map = {r["roster_id"]: r for r in rosters if r.get("roster_id") is not None}
-            if not roster_map:
-                raise ValueError(f"No rosters found for Sleeper league {league_id}.")
-
-            owner_map: dict[int, str] = {}
-            for roster in rosters:
-                rid = roster.get("roster_id")
-                if rid is None:
-                    continue
-                owner_map[rid] = self._lookup_owner_name(roster.get("owner_id"), users)
-
-            target_roster_id = roster_id if roster_id is not None else next(iter(roster_map))
-            target_roster = roster_map.get(target_roster_id)
-            if target_roster is None:
-                raise ValueError(
-                    f"Sleeper roster id {target_roster_id} was not found in league {league_id}."
-                )
+        Takes the same parameters as :meth:`advise_lineup`.
+        """
 
-            owner = owner_map.get(target_roster_id, "Unknown Manager")
-            player_ids = [pid for pid in target_roster.get("players", []) if pid]
-            player_details = await sleeper.get_player_details(player_ids)
+        prompt = await self._build_lineup_prompt(league_id=league_id, week=week, roster_id=roster_id)
+        stream = await self._openai.responses.create(
+            model="gpt-4.1-mini",
+            input=[{"role": "user", "content": prompt}],
+            temperature=0.4,
+            stream=True,
+        )
+        async with stream:
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+                elif event.type in ("error", "response.failed", "response.incomplete"):
+                    raise AdviceGenerationError(_describe_stream_failure(event))
+
+    async def _build_lineup_prompt(
+        self,
+        *,
+        league_id: str,
+        week: int,
+        roster_id: Optional[int],
+    ) -> str:
+        http_client = self._http_factory.client()
+        sleeper = SleeperClient(http_client)
+        espn = ESPNClient(
+            http_client,
+            espn_s2=self._credentials.espn_s2,
+            swid=self._credentials.swid,
+        )
+        fantasypros = FantasyProsClient(http_client, api_key=self._credentials.fantasypros_api_key)
+        weather = WeatherClient(http_client, api_key=self._credentials.openweather_api_key)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                rosters_task = tg.create_task(sleeper.get_league_rosters(league_id))
+                # owner names and matchups only enrich the prompt, so degrade instead of failing
+                users_task = tg.create_task(_default_on_http_error(sleeper.get_league_users(league_id), []))
+                matchups_task = tg.create_task(_default_on_http_error(sleeper.get_matchups(league_id, week), []))
+        except* httpx.HTTPError as group:
+            # only the rosters request can fail with an HTTP error; surface it unwrapped
+            raise group.exceptions[0] from None
+        rosters, users, matchups = rosters_task.result(), users_task.result(), matchups_task.result()
+
+        roster_map = {r["roster_id"]: r for r in rosters if r.get("roster_id") is not None}
+        if not roster_map:
+            raise ValueError(f"No rosters found for Sleeper league {league_id}.")
+
+        users_by_id = {user.get("user_id"): user for user in users}
+        owner_map: dict[int, str] = {}
+        for roster in rosters:
+            rid = roster.get("roster_id")
+            if rid is None:
+                continue
+            owner_map[rid] = _owner_display_name(users_by_id.get(roster.get("owner_id")))
+
+        target_roster_id = roster_id if roster_id is not None else next(iter(roster_map))
+        target_roster = roster_map.get(target_roster_id)
+        if target_roster is None:
+            raise ValueError(
+                f"Sleeper roster id {target_roster_id} was not found in league {league_id}."
+            )
+
+        owner = owner_map.get(target_roster_id, "Unknown Manager")
+        player_ids = [pid for pid in target_roster.get("players", []) if pid]
+        player_details = await sleeper.get_player_details(player_ids)
 
-            roster_matchups = _build_roster_matchups(matchups, owner_map)
-            player_matchups = _map_player_matchups(matchups, roster_matchups)
+        roster_matchups = _build_roster_matchups(matchups, owner_map)
+        player_matchups = _map_player_matchups(matchups, roster_matchups)
 
-            # Build contexts concurrently for efficiency
-            players_context: dict[str, PlayerContext] = {}
+        season = _current_season()
+        # Projections are per position and schedules per NFL team, so fetch each once for the
+        # whole roster. Players on IR will not suit up, so their game (and weather) is irrelevant.
+        positions = sorted(
+            {p.position for p in player_details.values() if p.position in FANTASYPROS_POSITIONS}
+        )
+        teams = sorted({p.team for p in player_details.values() if p.team and not _is_on_ir(p)})
+        async with asyncio.TaskGroup() as tg:
+            projection_tasks = [
+                tg.create_task(_fetch_position_projections(fantasypros, week, position))
+                for position in positions
+            ]
+            team_game_tasks = [
+                tg.create_task(
+                    _default_on_http_error(espn.get_team_game(team, season=season, week=week), None)
+                )
+                for team in teams
+            ]
+        team_games: dict[str, Optional[TeamGame]] = {
+            team: task.result() for team, task in zip(teams, team_game_tasks)
+        }
+        weekly_by_position: dict[str, dict[str, FantasyProsProjection]] = {}
+        ros_by_position: dict[str, dict[str, FantasyProsProjection]] = {}
+        for position, task in zip(positions, projection_tasks):
+            weekly, ros = task.result()
+            weekly_by_position[position] = index_projections_by_name(weekly)
+            ros_by_position[position] = index_projections_by_name(ros)
+
+        # Build contexts concurrently; a failure cancels the remaining players
+        players_context: dict[str, PlayerContext] = {}
+        async with asyncio.TaskGroup() as tg:
             tasks = [
-                self._build_player_context(
-                    sleeper_player=player_details.get(pid),
-                    espn_client=espn,
-                    fantasypros_client=fantasypros,
-                    weather_client=weather,
-                    matchup_text=player_matchups.get(pid),
-                    week=week,
+                tg.create_task(
+                    self._build_player_context(
+                        sleeper_player=player,
+                        espn_client=espn,
+                        weather_client=weather,
+                        team_game=(
+                            team_games.get(player.team) if player.team and not _is_on_ir(player) else None
+                        ),
+                        fantasypros_weekly=weekly_by_position,
+                        fantasypros_ros=ros_by_position,
+                        matchup_text=player_matchups.get(pid),
+                        season=season,
+                    )
                 )
                 for pid in player_ids
-                if player_details.get(pid)
+                if (player := player_details.get(pid))
             ]
 
-            results = await asyncio.gather(*tasks)
-            for context in results:
-                if context:
-                    players_context[context.sleeper.player_id] = context
-
-            team = TeamContext(
-                roster_id=target_roster["roster_id"],
-                owner=owner,
-                week=week,
-                players=players_context,
-            )
+        for task in tasks:
+            context = task.result()
+            if context:
+                players_context[context.sleeper.player_id] = context
 
-        prompt = build_prompt(team)
-        response = self._openai.responses.create(
-            model="gpt-4.1-mini",
-            input=[{"role": "user", "content": prompt}],
-            temperature=0.4,
+        team = TeamContext(
+            roster_id=target_roster["roster_id"],
+            owner=owner,
+            week=week,
+            players=players_context,
         )
-        return response.output_text
+
+        return build_prompt(team)
+
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections held by the advisor."""
+
+        await self._http_factory.aclose()
+        await self._openai.close()
 
     async def _build_player_context(
         self,
         *,
         sleeper_player: SleeperPlayer,
         espn_client: ESPNClient,
-        fantasypros_client: FantasyProsClient,
         weather_client: WeatherClient,
+        team_game: Optional[TeamGame],
+        fantasypros_weekly: Mapping[str, Mapping[str, FantasyProsProjection]],
+        fantasypros_ros: Mapping[str, Mapping[str, FantasyProsProjection]],
         matchup_text: Optional[str],
-        week: int,
+        season: int,
     ) -> Optional[PlayerContext]:
-        expected_role = _expected_role_from_status(sleeper_player)
-        team_game = None
-        weather = None
-
-        if sleeper_player.team:
-            try:
-                team_game = await espn_client.get_team_game(
-                    sleeper_player.team,
-                    season=_current_season(),
-                    week=week,
-                )
-            except httpx.HTTPError:
-                team_game = None
+        async with self._player_semaphore:
+            expected_role = _expected_role_from_status(sleeper_player)
+            weather = None
+
             if team_game and team_game.latitude and team_game.longitude and team_game.game_date:
                 try:
                     weather = await weather_client.forecast_for_location(
@@ -152,54 +242,65 @@ class FantasyAdvisor:
                 except httpx.HTTPError:
                     weather = None
 
-        recent_performance = []
-        if sleeper_player.espn_id:
-            try:
-                recent_performance = await espn_client.get_player_performance(
-                    sleeper_player.espn_id,
-                    season=_current_season(),
-                    limit=4,
-                )
-            except httpx.HTTPError:
-                recent_performance = []
-
-        fantasypros_weekly = None
-        fantasypros_ros = None
-        if sleeper_player.position:
-            fp_weekly = fp_ros = []
-            try:
-                fp_weekly, fp_ros = await asyncio.gather(
-                    fantasypros_client.get_weekly_projection(week, sleeper_player.position),
-                    fantasypros_client.get_rest_of_season_rank(sleeper_player.position),
-                )
-            except httpx.HTTPError:
-                fp_weekly, fp_ros = [], []
-            fantasypros_weekly = _find_projection_for_player(fp_weekly, sleeper_player.name)
-            fantasypros_ros = _find_projection_for_player(fp_ros, sleeper_player.name)
-
-        return PlayerContext(
-            sleeper=sleeper_player,
-            matchup=matchup_text,
-            expected_role=expected_role,
-            team_game=team_game,
-            weather=weather,
-            recent_performance=recent_performance,
-            fantasypros_weekly=fantasypros_weekly,
-            fantasypros_ros=fantasypros_ros,
-        )
+            recent_performance = []
+            if sleeper_player.espn_id:
+                try:
+                    recent_performance = await espn_client.get_player_performance(
+                        sleeper_player.espn_id,
+                        season=season,
+                        limit=4,
+                    )
+                except httpx.HTTPError:
+                    recent_performance = []
+
+            weekly_projection = None
+            ros_projection = None
+            if sleeper_player.position:
+                name_key = normalize_player_name(sleeper_player.name)
+                weekly_projection = fantasypros_weekly.get(sleeper_player.position, {}).get(name_key)
+                ros_projection = fantasypros_ros.get(sleeper_player.position, {}).get(name_key)
+
+            return PlayerContext(
+                sleeper=sleeper_player,
+                matchup=matchup_text,
+                expected_role=expected_role,
+                team_game=team_game,
+                weather=weather,
+                recent_performance=recent_performance,
+                fantasypros_weekly=weekly_projection,
+                fantasypros_ros=ros_projection,
+            )
 
-    def _lookup_owner_name(self, owner_id: str, users: Iterable[dict]) -> str:
-        for user in users:
-            if user.get("user_id") == owner_id:
-                return user.get("display_name") or user.get("username") or "Unknown Manager"
+
+def _owner_display_name(user: Optional[dict]) -> str:
+    if not user:
         return "Unknown Manager"
+    return user.get("display_name") or user.get("username") or "Unknown Manager"
 
 
 def _current_season() -> int:
-    today = datetime.utcnow()
+    today = datetime.now(timezone.utc)
     return today.year if today.month >= 3 else today.year - 1
 
 
+def _describe_stream_failure(event) -> str:
+    if event.type == "error":
+        return f"OpenAI stream error ({event.code or 'unknown'}): {event.message}"
+    response = event.response
+    if event.type == "response.incomplete":
+        details = response.incomplete_details
+        reason = details.reason if details else None
+        return f"OpenAI response incomplete: {reason or 'unknown reason'}"
+    error = response.error
+    if error is None:
+        return "OpenAI response failed without error details"
+    return f"OpenAI response failed ({error.code}): {error.message}"
+
+
+def _is_on_ir(player: SleeperPlayer) -> bool:
+    return (player.injury_status or "").lower() == "ir"
+
+
 def _expected_role_from_status(player: SleeperPlayer) -> str:
     status = (player.injury_status or "").lower()
     if status == "ir":
@@ -209,39 +310,43 @@ def _expected_role_from_status(player: SleeperPlayer) -> str:
     return "Projected starter"
 
 
-def _find_projection_for_player(
-    projections: Iterable, player_name: Optional[str]
-):
-    normalized = (player_name or "").lower()
-    for projection in projections:
-        if projection.name and projection.name.lower() == normalized:
-            return projection
-    return None
+async def _fetch_position_projections(
+    client: FantasyProsClient, week: int, position: str
+) -> tuple[list[FantasyProsProjection], list[FantasyProsProjection]]:
+    async with asyncio.TaskGroup() as tg:
+        weekly = tg.create_task(_default_on_http_error(client.get_weekly_projection(week, position), []))
+        ros = tg.create_task(_default_on_http_error(client.get_rest_of_season_rank(position), []))
+    return weekly.result(), ros.result()
+
+
+async def _default_on_http_error(awaitable: Awaitable[_T], default: _T) -> _T:
+    """Await ``awaitable``, returning ``default`` if it fails with an HTTP error."""
+
+    try:
+        return await awaitable
+    except httpx.HTTPError:
+        return default
 
 
 def _build_roster_matchups(matchups: Iterable[dict], owner_map: dict[int, str]) -> dict[int, dict[str, Optional[str]]]:
-    by_matchup: dict[int, list[dict]] = {}
+    by_matchup: dict[int, list[int]] = {}
     for matchup in matchups:
         matchup_id = matchup.get("matchup_id")
-        if matchup_id is None:
+        roster_id = matchup.get("roster_id")
+        if matchup_id is None or roster_id is None:
             continue
-        by_matchup.setdefault(matchup_id, []).append(matchup)
+        by_matchup.setdefault(matchup_id, []).append(roster_id)
 
     roster_matchups: dict[int, dict[str, Optional[str]]] = {}
-    for matchup_id, roster_entries in by_matchup.items():
-        for entry in roster_entries:
-            roster_id = entry.get("roster_id")
-            if roster_id is None:
-                continue
-            opponent_entry = next(
-                (e for e in roster_entries if e.get("roster_id") != roster_id),
-                None,
-            )
-            opponent_roster_id = opponent_entry.get("roster_id") if opponent_entry else None
+    for matchup_id, roster_ids in by_matchup.items():
+        # a head-to-head matchup pairs exactly two rosters; anything else has no single opponent
+        paired = len(roster_ids) == 2
+        for i, roster_id in enumerate(roster_ids):
+            opponent_roster_id = roster_ids[1 - i] if paired else None
             roster_matchups[roster_id] = {
                 "matchup_id": matchup_id,
                 "opponent_roster_id": opponent_roster_id,
-                "opponent_owner": owner_map.get(opponent_roster_id) if opponent_roster_id else None,
+                "opponent_owner": owner_map.get(opponent_roster_id) if opponent_roster_id is not None else None,
             }
     return roster_matchups
 
@@ -262,4 +367,4 @@ def _map_player_matchups(matchups: Iterable[dict], roster_matchups: dict[int, di
     return player_lookup
 
 
-__all__ = ["FantasyAdvisor"]
+__all__ = ["AdviceGenerationError", "FantasyAdvisor"]
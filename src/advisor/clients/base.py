@@ -1,26 +1,87 @@
 """Shared HTTP client utilities."""
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional
+import asyncio
+from contextlib import nullcontext
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
 
 import httpx
-from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
+import orjson
+from ciso8601 import parse_datetime
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, wait_exponential
 
 
 _DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+_BACKOFF = wait_exponential(multiplier=0.6, min=1, max=8)
+_MAX_RETRY_AFTER = 30.0
 
 
 class HttpClientFactory:
-    """Factory responsible for creating shared :class:`httpx.AsyncClient` instances."""
+    """Factory responsible for the shared :class:`httpx.AsyncClient` instance.
 
-    def __init__(self, timeout: Optional[httpx.Timeout] = None) -> None:
+    The client is created lazily on the first :meth:`client` call and reused
+    afterwards so keep-alive connections (multiplexed over HTTP/2 where the
+    vendor supports it) survive across advisor runs. Call :meth:`aclose` once
+    the client is no longer needed.
+    """
+
+    def __init__(self, timeout: Optional[httpx.Timeout] = None, limits: Optional[httpx.Limits] = None) -> None:
         self._timeout = timeout or _DEFAULT_TIMEOUT
+        self._limits = limits or _DEFAULT_LIMITS
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(http2=True, timeout=self._timeout, limits=self._limits)
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with :mod:`orjson`."""
+
+    return orjson.loads(response.content)
+
 
-    @asynccontextmanager
-    async def client(self) -> AsyncIterator[httpx.AsyncClient]:
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            yield client
+@lru_cache(maxsize=1024)
+def parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (``Z`` suffix included), returning ``None`` when invalid.
+
+    Results are memoized because the same kickoff times recur across teams and events.
+    """
+
+    if not value:
+        return None
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return None
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.RequestError)
+
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+    return _BACKOFF(retry_state)
 
 
 async def robust_get(
@@ -29,19 +90,36 @@ async def robust_get(
     *,
     params: Optional[dict] = None,
     headers: Optional[dict] = None,
+    limiter: Optional[asyncio.Semaphore] = None,
+    attempt_timeout: Optional[float] = None,
 ) -> httpx.Response:
-    """Issue a GET request with sensible retries."""
+    """Issue a GET request with sensible retries.
+
+    Connection errors, 429 and 5xx responses are retried, honouring a numeric
+    ``Retry-After`` header when the server sends one; other 4xx responses raise
+    immediately. When ``limiter`` is given it is held for the duration of each attempt (but
+    not while backing off), capping the number of in-flight requests per vendor.
+    ``attempt_timeout`` bounds each attempt in seconds once the limiter is acquired;
+    an attempt that overruns raises :class:`httpx.TimeoutException` and is retried.
+    """
 
     async for attempt in AsyncRetrying(
-        wait=wait_exponential(multiplier=0.6, min=1, max=8),
+        wait=_wait_before_retry,
         stop=stop_after_attempt(3),
-        retry=retry_if_exception_type(httpx.RequestError),
+        retry=retry_if_exception(_is_transient),
         reraise=True,
     ):
         with attempt:
-            response = await client.get(url, params=params, headers=headers)
+            async with limiter or nullcontext():
+                try:
+                    async with asyncio.timeout(attempt_timeout):
+                        response = await client.get(url, params=params, headers=headers)
+                except TimeoutError as exc:
+                    raise httpx.TimeoutException(
+                        f"GET {url} did not complete within {attempt_timeout}s"
+                    ) from exc
             response.raise_for_status()
             return response
 
 
-__all__ = ["HttpClientFactory", "robust_get"]
+__all__ = ["HttpClientFactory", "decode_json", "parse_iso_datetime", "robust_get"]
@@ -1,17 +1,23 @@
 """ESPN data client for advanced context."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Iterable, Optional
 
 import httpx
 
-from .base import robust_get
+from .base import decode_json, parse_iso_datetime, robust_get
 
 
 BASE_URL = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
 KONA_PLAYER_URL = "https://site.api.espn.com/apis/fantasy/v2/games/ffl/seasons/{season}/segments/0/leaguedefaults/1"
+MAX_CONCURRENT_REQUESTS = 10
+COOKIE_DOMAIN = ".espn.com"
+# per-attempt budgets in seconds
+SCHEDULE_TIMEOUT = 5.0
+SUMMARY_TIMEOUT = 4.0
 
 
 @dataclass(slots=True)
@@ -38,25 +44,35 @@ class TeamGame:
 class ESPNClient:
     def __init__(self, client: httpx.AsyncClient, *, espn_s2: Optional[str] = None, swid: Optional[str] = None) -> None:
         self._client = client
-        self._cookies = {}
+        self._limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # scope the auth cookies to ESPN so the shared client never sends them to other vendors
         if espn_s2:
-            self._cookies["espn_s2"] = espn_s2
+            client.cookies.set("espn_s2", espn_s2, domain=COOKIE_DOMAIN)
         if swid:
-            self._cookies["SWID"] = swid
+            client.cookies.set("SWID", swid, domain=COOKIE_DOMAIN)
 
     async def get_player_performance(self, espn_player_id: str, *, season: int, limit: int = 5) -> list[PlayerPerformance]:
         """Fetch recent player performance stats."""
 
         player_url = f"{BASE_URL}/athletes/{espn_player_id}/events"
-        response = await robust_get(self._client, player_url)
-        events: list[dict[str, Any]] = response.json().get("items", [])
+        response = await robust_get(
+            self._client,
+            player_url,
+            limiter=self._limiter,
+            attempt_timeout=SUMMARY_TIMEOUT,
+        )
+        events: list[dict[str, Any]] = decode_json(response).get("items", [])
         performances: list[PlayerPerformance] = []
 
-        for event in events[:limit]:
-            try:
-                summary = await self._fetch_event_summary(event.get("$ref"))
-            except httpx.HTTPError:
+        summaries = await asyncio.gather(
+            *(self._fetch_event_summary(event.get("$ref")) for event in events[:limit]),
+            return_exceptions=True,
+        )
+        for summary in summaries:
+            if isinstance(summary, httpx.HTTPError):
                 continue
+            if isinstance(summary, BaseException):
+                raise summary
 
             competitions = summary.get("competitions", [])
             if not competitions:
@@ -64,12 +80,7 @@ class ESPNClient:
             competition = competitions[0]
             status = competition.get("status", {}).get("type", {})
             date_str = status.get("detail") or competition.get("date")
-            game_date = None
-            if date_str:
-                try:
-                    game_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except ValueError:
-                    pass
+            game_date = parse_iso_datetime(date_str)
 
             # determine opponent info
             teams = competition.get("competitors", [])
@@ -116,13 +127,23 @@ class ESPNClient:
         """Return the schedule info for a team in the given week."""
 
         schedule_url = f"{BASE_URL}/teams/{team_abbrev.lower()}/schedule"
-        response = await robust_get(self._client, schedule_url)
-        items: list[dict[str, Any]] = response.json().get("items", [])
-        for item in items:
-            ref = item.get("$ref")
-            if not ref:
+        response = await robust_get(
+            self._client,
+            schedule_url,
+            limiter=self._limiter,
+            attempt_timeout=SCHEDULE_TIMEOUT,
+        )
+        items: list[dict[str, Any]] = decode_json(response).get("items", [])
+        refs = [item["$ref"] for item in items if item.get("$ref")]
+        schedules = await asyncio.gather(
+            *(self._fetch_schedule_item(ref) for ref in refs),
+            return_exceptions=True,
+        )
+        for schedule in schedules:
+            if isinstance(schedule, httpx.HTTPError):
                 continue
-            schedule = await self._fetch_schedule_item(ref)
+            if isinstance(schedule, BaseException):
+                raise schedule
             game_week = schedule.get("week", {}).get("number")
             if game_week != week:
                 continue
@@ -139,12 +160,7 @@ class ESPNClient:
                     opponent_abbrev = competitor.get("team", {}).get("abbreviation")
                     break
             date_str = comp.get("date")
-            game_date = None
-            if date_str:
-                try:
-                    game_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except ValueError:
-                    pass
+            game_date = parse_iso_datetime(date_str)
 
             return TeamGame(
                 opponent_abbrev=opponent_abbrev,
@@ -159,12 +175,24 @@ class ESPNClient:
     async def _fetch_event_summary(self, url: Optional[str]) -> dict[str, Any]:
         if not url:
             return {}
-        response = await robust_get(self._client, url, headers={"Accept": "application/json"})
-        return response.json()
+        response = await robust_get(
+            self._client,
+            url,
+            headers={"Accept": "application/json"},
+            limiter=self._limiter,
+            attempt_timeout=SUMMARY_TIMEOUT,
+        )
+        return decode_json(response)
 
     async def _fetch_schedule_item(self, url: str) -> dict[str, Any]:
-        response = await robust_get(self._client, url, headers={"Accept": "application/json"})
-        return response.json()
+        response = await robust_get(
+            self._client,
+            url,
+            headers={"Accept": "application/json"},
+            limiter=self._limiter,
+            attempt_timeout=SCHEDULE_TIMEOUT,
+        )
+        return decode_json(response)
 
 
 def _safe_float(value: Any) -> Optional[float]:
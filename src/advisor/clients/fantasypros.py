@@ -1,15 +1,18 @@
 """FantasyPros data client."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import httpx
 
-from .base import robust_get
+from .base import decode_json, robust_get
 
 
 BASE_URL = "https://api.fantasypros.com/public/v2/json/nfl"
+MAX_CONCURRENT_REQUESTS = 4
+REQUEST_TIMEOUT = 3.0
 
 
 @dataclass(slots=True)
@@ -27,14 +30,22 @@ class FantasyProsClient:
     def __init__(self, client: httpx.AsyncClient, *, api_key: Optional[str] = None) -> None:
         self._client = client
         self._api_key = api_key
+        self._limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     async def get_rest_of_season_rank(self, position: str) -> list[FantasyProsProjection]:
         """Return rest-of-season projections for a given position."""
 
         url = f"{BASE_URL}/players/ros"
         headers = {"x-api-key": self._api_key} if self._api_key else None
-        response = await robust_get(self._client, url, params={"position": position}, headers=headers)
-        payload = response.json()
+        response = await robust_get(
+            self._client,
+            url,
+            params={"position": position},
+            headers=headers,
+            limiter=self._limiter,
+            attempt_timeout=REQUEST_TIMEOUT,
+        )
+        payload = decode_json(response)
         players = payload.get("players", [])
         projections: list[FantasyProsProjection] = []
         for player in players:
@@ -59,8 +70,10 @@ class FantasyProsClient:
             url,
             params={"week": week, "position": position},
             headers=headers,
+            limiter=self._limiter,
+            attempt_timeout=REQUEST_TIMEOUT,
         )
-        payload = response.json()
+        payload = decode_json(response)
         players = payload.get("players", [])
         projections: list[FantasyProsProjection] = []
         for player in players:
@@ -78,6 +91,24 @@ class FantasyProsClient:
         return projections
 
 
+def normalize_player_name(name: Optional[str]) -> str:
+    """Return the key used to match player names across data sources."""
+
+    return (name or "").casefold()
+
+
+def index_projections_by_name(
+    projections: Iterable[FantasyProsProjection],
+) -> dict[str, FantasyProsProjection]:
+    """Index projections by normalized player name, keeping the first entry per name."""
+
+    index: dict[str, FantasyProsProjection] = {}
+    for projection in projections:
+        if projection.name:
+            index.setdefault(normalize_player_name(projection.name), projection)
+    return index
+
+
 def _safe_float(value: Any) -> Optional[float]:
     try:
         return float(value)
@@ -85,4 +116,9 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
-__all__ = ["FantasyProsClient", "FantasyProsProjection"]
+__all__ = [
+    "FantasyProsClient",
+    "FantasyProsProjection",
+    "index_projections_by_name",
+    "normalize_player_name",
+]
@@ -1,15 +1,39 @@
 """Async client for Sleeper fantasy football data."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import os
+import tempfile
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 import httpx
+import orjson
 
-from .base import robust_get
+from .base import decode_json, robust_get
 
 
 BASE_URL = "https://api.sleeper.app/v1"
+MAX_CONCURRENT_REQUESTS = 4
+# per-attempt budget for league endpoints; the multi-megabyte player dump keeps the client timeout
+REQUEST_TIMEOUT = 3.0
+PLAYERS_CACHE_PATH = Path(tempfile.gettempdir()) / "sleeper_players.json"
+# Sleeper asks clients to pull /players/nfl at most once per day
+PLAYERS_CACHE_TTL = 24 * 60 * 60
+# The only /players/nfl fields read by get_player_details; everything else is dropped at ingest
+PLAYER_FIELDS = (
+    "full_name",
+    "first_name",
+    "position",
+    "team",
+    "injury_status",
+    "injury_notes",
+    "fantasy_positions",
+    "espn_id",
+)
 
 
 @dataclass(slots=True)
@@ -27,48 +51,118 @@ class SleeperPlayer:
 class SleeperClient:
     """Wrapper around the Sleeper HTTP API."""
 
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        players_cache_path: Optional[Path] = PLAYERS_CACHE_PATH,
+    ) -> None:
         self._client = client
+        self._limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         self._players_cache: Optional[Mapping[str, dict[str, Any]]] = None
+        self._players_cache_path = players_cache_path
 
     async def get_league_rosters(self, league_id: str) -> list[dict[str, Any]]:
-        response = await robust_get(self._client, f"{BASE_URL}/league/{league_id}/rosters")
-        return response.json()
+        response = await robust_get(
+            self._client,
+            f"{BASE_URL}/league/{league_id}/rosters",
+            limiter=self._limiter,
+            attempt_timeout=REQUEST_TIMEOUT,
+        )
+        return decode_json(response)
 
     async def get_league_users(self, league_id: str) -> list[dict[str, Any]]:
-        response = await robust_get(self._client, f"{BASE_URL}/league/{league_id}/users")
-        return response.json()
+        response = await robust_get(
+            self._client,
+            f"{BASE_URL}/league/{league_id}/users",
+            limiter=self._limiter,
+            attempt_timeout=REQUEST_TIMEOUT,
+        )
+        return decode_json(response)
 
     async def get_matchups(self, league_id: str, week: int) -> list[dict[str, Any]]:
         response = await robust_get(
             self._client,
             f"{BASE_URL}/league/{league_id}/matchups/{week}",
+            limiter=self._limiter,
+            attempt_timeout=REQUEST_TIMEOUT,
         )
-        return response.json()
+        return decode_json(response)
 
     async def get_player_details(self, player_ids: Iterable[str]) -> dict[str, SleeperPlayer]:
         player_map = await self._get_all_players()
         result: dict[str, SleeperPlayer] = {}
         for player_id in player_ids:
             raw = player_map.get(player_id)
-            if raw:
-                result[player_id] = SleeperPlayer(
-                    player_id=player_id,
-                    name=raw.get("full_name") or raw.get("first_name"),
-                    position=raw.get("position"),
-                    team=raw.get("team"),
-                    injury_status=raw.get("injury_status"),
-                    injury_notes=raw.get("injury_notes"),
-                    fantasy_positions=list(raw.get("fantasy_positions") or []),
-                    espn_id=str(raw["espn_id"]) if raw.get("espn_id") else None,
-                )
+            if not raw:
+                continue
+            espn_id = raw.get("espn_id")
+            result[player_id] = SleeperPlayer(
+                player_id=player_id,
+                name=raw.get("full_name") or raw.get("first_name"),
+                position=raw.get("position"),
+                team=raw.get("team"),
+                injury_status=raw.get("injury_status"),
+                injury_notes=raw.get("injury_notes"),
+                # shared with the client's player cache (no defensive copy); must not be mutated
+                fantasy_positions=raw.get("fantasy_positions") or [],
+                espn_id=str(espn_id) if espn_id else None,
+            )
         return result
 
     async def _get_all_players(self) -> Mapping[str, dict[str, Any]]:
         if self._players_cache is None:
-            response = await robust_get(self._client, f"{BASE_URL}/players/nfl")
-            self._players_cache = response.json()
+            players = self._read_players_file()
+            if players is None:
+                response = await robust_get(
+                    self._client,
+                    f"{BASE_URL}/players/nfl",
+                    limiter=self._limiter,
+                )
+                players = _project_players(decode_json(response))
+                self._write_players_file(orjson.dumps(players))
+            self._players_cache = players
         return self._players_cache
 
+    def _read_players_file(self) -> Optional[Mapping[str, dict[str, Any]]]:
+        path = self._players_cache_path
+        if path is None:
+            return None
+        try:
+            st = path.stat()
+            # the cache lives in a shared temp dir, so only trust a fresh file this user wrote
+            if st.st_uid != os.getuid() or not 0 <= time.time() - st.st_mtime < PLAYERS_CACHE_TTL:
+                return None
+            players = orjson.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        # anything but a JSON object is as unusable as a corrupt file, so refetch
+        return players if isinstance(players, dict) else None
+
+    def _write_players_file(self, payload: bytes) -> None:
+        path = self._players_cache_path
+        if path is None:
+            return
+        # Stage into a freshly created (O_EXCL, owner-only) file beside the target so readers never
+        # see a partial payload and a pre-planted symlink in the shared temp dir cannot be followed.
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_name, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+
+def _project_players(raw_players: Mapping[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return {
+        player_id: {field: raw.get(field) for field in PLAYER_FIELDS}
+        for player_id, raw in raw_players.items()
+    }
+
 
 __all__ = ["SleeperClient", "SleeperPlayer"]
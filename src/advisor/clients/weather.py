@@ -1,16 +1,20 @@
 """OpenWeatherMap client."""
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
 import httpx
 
-from .base import robust_get
+from .base import decode_json, robust_get
 
 
 API_URL = "https://api.openweathermap.org/data/2.5/forecast"
+MAX_CONCURRENT_REQUESTS = 4
+REQUEST_TIMEOUT = 4.0
 
 
 @dataclass(slots=True)
@@ -26,6 +30,7 @@ class WeatherClient:
     def __init__(self, client: httpx.AsyncClient, *, api_key: str) -> None:
         self._client = client
         self._api_key = api_key
+        self._limiter = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     async def forecast_for_location(
         self,
@@ -40,8 +45,14 @@ class WeatherClient:
             "appid": self._api_key,
             "units": "imperial",
         }
-        response = await robust_get(self._client, API_URL, params=params)
-        payload = response.json()
+        response = await robust_get(
+            self._client,
+            API_URL,
+            params=params,
+            limiter=self._limiter,
+            attempt_timeout=REQUEST_TIMEOUT,
+        )
+        payload = decode_json(response)
         items = payload.get("list", [])
         if not items:
             return None
@@ -52,10 +63,12 @@ class WeatherClient:
         else:
             kickoff = kickoff.astimezone(timezone.utc)
         target_timestamp = kickoff.timestamp()
-        closest = min(
-            items,
-            key=lambda item: abs(item.get("dt", 0) - target_timestamp),
-        )
+        # OpenWeatherMap returns forecast slots in ascending ``dt`` order, so only the
+        # slots on either side of the insertion point can be closest to kickoff.
+        timestamps = [item.get("dt", 0) for item in items]
+        idx = bisect_left(timestamps, target_timestamp)
+        neighbours = items[max(0, idx - 1) : idx + 1]
+        closest = min(neighbours, key=lambda item: abs(item.get("dt", 0) - target_timestamp))
         weather = closest.get("weather", [{}])[0]
         main = closest.get("main", {})
         wind = closest.get("wind", {})
@@ -1,9 +1,11 @@
 """Data models for aggregating fantasy information."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from functools import wraps
+from typing import Callable, Optional, TypeVar
 
 from .clients.espn import PlayerPerformance, TeamGame
 from .clients.fantasypros import FantasyProsProjection
@@ -11,6 +13,42 @@ from .clients.sleeper import SleeperPlayer
 from .clients.weather import WeatherForecast
 
 
+_HIGH_RISK = frozenset(("ir", "out", "doubtful"))
+_MONITOR = frozenset(("questionable", "suspension"))
+
+# Summary strings shared by most players; interned so downstream comparisons can hit identity
+_NO_INJ = sys.intern("No reported injuries.")
+_HIGH_RISK_FLAG = sys.intern("high-risk availability")
+_MONITOR_FLAG = sys.intern("monitor closely")
+_CLEARED = sys.intern("cleared")
+_INDOOR = sys.intern("Indoor or weather data unavailable.")
+_NO_PERF = sys.intern("No recent performance data.")
+_NO_FANTASYPROS = sys.intern("No FantasyPros data.")
+
+
+_ContextT = TypeVar("_ContextT", "PlayerContext", "TeamContext")
+
+
+def _memoized(method: Callable[[_ContextT], str]) -> Callable[[_ContextT], str]:
+    """Cache a summary method's result in the instance's ``_summaries`` dict.
+
+    Contexts are built once per run and never mutated afterwards, so a summary
+    computed for one prompt stays valid for every later rebuild.
+    """
+
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: _ContextT) -> str:
+        try:
+            return self._summaries[name]
+        except KeyError:
+            value = self._summaries[name] = method(self)
+            return value
+
+    return wrapper
+
+
 @dataclass(slots=True)
 class PlayerContext:
     sleeper: SleeperPlayer
@@ -21,42 +59,56 @@ class PlayerContext:
     recent_performance: list[PlayerPerformance] = field(default_factory=list)
     fantasypros_weekly: Optional[FantasyProsProjection] = None
     fantasypros_ros: Optional[FantasyProsProjection] = None
+    _summaries: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
+    @_memoized
     def injury_summary(self) -> str:
         if not self.sleeper.injury_status:
-            return "No reported injuries."
+            return _NO_INJ
         details = self.sleeper.injury_status.upper()
         if self.sleeper.injury_notes:
             details = f"{details} - {self.sleeper.injury_notes}"
         return details
 
+    @_memoized
     def availability_flag(self) -> str:
         status = (self.sleeper.injury_status or "").lower()
-        if status in {"ir", "out", "doubtful"}:
-            return "high-risk availability"
-        if status in {"questionable", "suspension"}:
-            return "monitor closely"
-        return "cleared"
+        if status in _HIGH_RISK:
+            return _HIGH_RISK_FLAG
+        if status in _MONITOR:
+            return _MONITOR_FLAG
+        return _CLEARED
 
+    @_memoized
     def weather_summary(self) -> str:
         if not self.weather:
-            return "Indoor or weather data unavailable."
+            return _INDOOR
         w = self.weather
         return (
             f"{w.summary} at {w.temperature_f:.0f}F, wind {w.wind_mph:.0f} mph, "
             f"precipitation chance {w.precipitation_probability:.0f}%"
         )
 
+    @_memoized
     def performance_summary(self) -> str:
         if not self.recent_performance:
-            return "No recent performance data."
-        parts = []
-        for perf in self.recent_performance:
-            pts = f"{perf.fantasy_points:.1f} pts" if perf.fantasy_points is not None else "N/A"
-            snap = f"{perf.snap_percentage:.0f}% snaps" if perf.snap_percentage is not None else "snap % N/A"
-            parts.append(f"{perf.game_date.date()}: {pts}, {snap} vs {perf.opponent}")
-        return " | ".join(parts)
+            return _NO_PERF
+        return " | ".join(
+            [
+                f"{game_day}: {pts}, {snap} vs {opponent}"
+                for game_day, pts, snap, opponent in (
+                    (
+                        perf.game_date.date(),
+                        f"{perf.fantasy_points:.1f} pts" if perf.fantasy_points is not None else "N/A",
+                        f"{perf.snap_percentage:.0f}% snaps" if perf.snap_percentage is not None else "snap % N/A",
+                        perf.opponent,
+                    )
+                    for perf in self.recent_performance
+                )
+            ]
+        )
 
+    @_memoized
     def fantasypros_summary(self) -> str:
         pieces: list[str] = []
         if self.fantasypros_weekly:
@@ -73,7 +125,7 @@ class PlayerContext:
                 if fp.projection is not None and fp.expert_consensus_rank is not None
                 else "ROS ranking available"
             )
-        return " | ".join(pieces) if pieces else "No FantasyPros data."
+        return " | ".join(pieces) if pieces else _NO_FANTASYPROS
 
 
 @dataclass(slots=True)
@@ -82,7 +134,9 @@ class TeamContext:
     owner: str
     week: int
     players: dict[str, PlayerContext]
+    _summaries: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
+    @_memoized
     def summary(self) -> str:
         lines = [f"Lineup recommendations for {self.owner} (week {self.week}):"]
         for player_ctx in self.players.values():
@@ -1,44 +1,49 @@
 """Prompt construction for OpenAI."""
 from __future__ import annotations
 
+import io
 from typing import Iterable
 
 from .models import PlayerContext, TeamContext
 
 
+# Static prompt text, pre-rendered with its separators so build_prompt only splices in team data
+_PROMPT_HEADER = (
+    "You are an elite fantasy football analyst. Provide a concise but thorough recommendation\n"
+    "for the starting lineup this week. Prioritize player availability, expected workload,\n"
+    "weather risk, opponent strength, and recent performance trends. Highlight any players\n"
+    "returning from injury reserve (IR) or with limited practice participation. Recommend\n"
+    "specific start/sit decisions and justify them with the data provided.\n"
+    "\n\n"
+)
+_PROMPT_FOOTER = (
+    "\n\nRespond with actionable advice, including a ranked list of suggested starters,"
+    "bench considerations, and matchup/weather caveats."
+)
+
+
 def build_player_section(player: PlayerContext) -> str:
-    lines = [
-        f"Player: {player.sleeper.name} ({player.sleeper.position})",
-        f"Team: {player.sleeper.team or 'FA'} vs {player.matchup or 'TBD'}",
-        f"Injury: {player.injury_summary()} ({player.availability_flag()})",
-        f"Role: {player.expected_role or 'Not specified'}",
-        f"Weather: {player.weather_summary()}",
-        f"Recent performance: {player.performance_summary()}",
-        f"FantasyPros: {player.fantasypros_summary()}",
-    ]
-    return "\n".join(lines)
+    return (
+        f"Player: {player.sleeper.name} ({player.sleeper.position})\n"
+        f"Team: {player.sleeper.team or 'FA'} vs {player.matchup or 'TBD'}\n"
+        f"Injury: {player.injury_summary()} ({player.availability_flag()})\n"
+        f"Role: {player.expected_role or 'Not specified'}\n"
+        f"Weather: {player.weather_summary()}\n"
+        f"Recent performance: {player.performance_summary()}\n"
+        f"FantasyPros: {player.fantasypros_summary()}"
+    )
 
 
 def build_prompt(team: TeamContext) -> str:
-    sections = [
-        "You are an elite fantasy football analyst. Provide a concise but thorough recommendation",
-        "for the starting lineup this week. Prioritize player availability, expected workload,",
-        "weather risk, opponent strength, and recent performance trends. Highlight any players",
-        "returning from injury reserve (IR) or with limited practice participation. Recommend",
-        "specific start/sit decisions and justify them with the data provided.",
-        "\n",
-        team.summary(),
-        "\nPlayer details:",
-    ]
-
+    buffer = io.StringIO()
+    buffer.write(_PROMPT_HEADER)
+    buffer.write(team.summary())
+    buffer.write("\n\nPlayer details:")
     for player in team.players.values():
-        sections.append("\n" + build_player_section(player))
-
-    sections.append(
-        "\nRespond with actionable advice, including a ranked list of suggested starters,"
-        "bench considerations, and matchup/weather caveats."
-    )
-    return "\n".join(sections)
+        buffer.write("\n\n")
+        buffer.write(build_player_section(player))
+    buffer.write(_PROMPT_FOOTER)
+    return buffer.getvalue()
 
 
 __all__ = ["build_prompt", "build_player_section"]